@@ -0,0 +1,159 @@
+"""Response compression with zstd / Brotli / gzip content negotiation."""
+import zlib
+from typing import Callable, Optional
+
+import brotli
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# Supported encodings, most preferred first
+ENCODINGS = ("zstd", "br", "gzip")
+
+
+def choose_encoding(accept_encoding: str, encodings: tuple[str, ...] = ENCODINGS) -> Optional[str]:
+    """Pick the most preferred of `encodings` the client accepts, if any."""
+    accepted = set()
+    refused = set()
+    for part in accept_encoding.split(","):
+        token, _, params = part.partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        
+        # Honour explicit refusals such as "br;q=0"
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(token)
+        else:
+            refused.add(token)
+    
+    # "*" only covers encodings the client did not list explicitly
+    wildcard = "*" in accepted
+    for encoding in encodings:
+        if encoding in accepted or (wildcard and encoding not in refused):
+            return encoding
+    return None
+
+
+class CompressionMiddleware:
+    """Compress responses with the best encoding the client supports."""
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1000,
+        zstd_level: int = 3,
+        brotli_quality: int = 4,
+        gzip_level: int = 6,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.zstd_level = zstd_level
+        self.brotli_quality = brotli_quality
+        self.gzip_level = gzip_level
+    
+    def _new_compressor(self, encoding: str) -> tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+        """Return (compress, finish) callables for a fresh compression stream."""
+        if encoding == "zstd":
+            # Compression objects share their compressor's native context, so
+            # concurrent (interleaved) responses each need their own compressor
+            stream = zstandard.ZstdCompressor(level=self.zstd_level).compressobj()
+            return stream.compress, stream.flush
+        if encoding == "br":
+            stream = brotli.Compressor(quality=self.brotli_quality)
+            return stream.process, stream.finish
+        
+        stream = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return stream.compress, stream.flush
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Per-response state for CompressionMiddleware."""
+    
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream_send = send
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+        self.compress: Optional[Callable[[bytes], bytes]] = None
+        self.finish: Optional[Callable[[], bytes]] = None
+    
+    async def send(self, message: Message):
+        message_type = message["type"]
+        
+        if message_type == "http.response.start":
+            # Hold the start message until the first body chunk shows its size
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or headers.get("content-type", "").startswith("text/event-stream")
+            )
+            return
+        
+        if message_type != "http.response.body":
+            await self.downstream_send(message)
+            return
+        
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        
+        if not self.started:
+            self.started = True
+            
+            # Already encoded, streamed events, or too small to be worth it
+            if self.passthrough or (len(body) < self.middleware.minimum_size and not more_body):
+                self.passthrough = True
+                await self.downstream_send(self.initial_message)
+                await self.downstream_send(message)
+                return
+            
+            self.compress, self.finish = self.middleware._new_compressor(self.encoding)
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers["Content-Encoding"] = self.encoding
+            # The app may already vary on it (e.g. pre-encoded responses)
+            if "accept-encoding" not in headers.get("vary", "").lower():
+                headers.add_vary_header("Accept-Encoding")
+            
+            if more_body:
+                # Final size is unknown while streaming
+                del headers["Content-Length"]
+                message["body"] = self.compress(body)
+            else:
+                message["body"] = self.compress(body) + self.finish()
+                headers["Content-Length"] = str(len(message["body"]))
+            
+            await self.downstream_send(self.initial_message)
+            await self.downstream_send(message)
+            return
+        
+        if self.passthrough:
+            await self.downstream_send(message)
+            return
+        
+        message["body"] = self.compress(body) + (b"" if more_body else self.finish())
+        await self.downstream_send(message)
@@ -1,10 +1,16 @@
 """ThreadSeeker V2 - The Autonomous Research Engine API with Zero-Cost Scaling."""
+import asyncio
+import gzip
 import time
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Optional
 
-from fastapi import FastAPI, HTTPException, Header
+from fastapi import FastAPI, HTTPException, Header, Request
+from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
+import brotli
+import orjson
 
 from ai_logic import (
     generate_search_queries, 
@@ -14,7 +20,10 @@ from ai_logic import (
     refine_query_with_answers
 )
 from models import (
+    GitHubResult,
     HealthResponse,
+    HuggingFaceResult,
+    RedditResult,
     SearchRequest,
     SearchResults,
     QueryRefinementResponse,
@@ -22,6 +31,7 @@ from models import (
 from search_logic import execute_parallel_search
 from ranking import rank_github_results, rank_huggingface_results, rank_reddit_results
 from cache import get_cache
+from compression import choose_encoding
 from content_extractor import extract_multiple_urls
 from security import (
     setup_security_middleware,
@@ -37,7 +47,13 @@ async def lifespan(app: FastAPI):
     print("🔄 Initializing cache...")
     cache = get_cache()
     print(f"✅ Cache status: {'enabled' if cache.enabled else 'disabled'}")
+    # Warm trending in the background unless another worker or instance
+    # already cached fresh data; requests get static data meanwhile
+    if not await cache.get("trending", "latest"):
+        refresh_trending_in_background()
     yield
+    if _trending_refresh is not None:
+        _trending_refresh.cancel()
     print("👋 ThreadSeeker V2 API shutting down...")
 
 
@@ -242,17 +258,73 @@ async def search(request: SearchRequest, x_groq_api_key: Optional[str] = Header(
         )
 
 
+@lru_cache(maxsize=None)
+def static_trending_models() -> tuple[tuple[GitHubResult, ...], tuple[HuggingFaceResult, ...], tuple[RedditResult, ...]]:
+    """Parse the static trending records into response models once."""
+    from static_trending import github_rows, huggingface_rows, reddit_rows
+    
+    return (
+        tuple(GitHubResult.model_validate(item, from_attributes=True) for item in github_rows()),
+        tuple(HuggingFaceResult.model_validate(item, from_attributes=True) for item in huggingface_rows()),
+        tuple(RedditResult.model_validate(item, from_attributes=True) for item in reddit_rows()),
+    )
+
+
+# Pre-compressed variants of the static payload, most preferred first
+STATIC_ENCODINGS = ("br", "gzip")
+
+
+@lru_cache(maxsize=None)
+def static_trending_payload() -> dict[Optional[str], bytes]:
+    """Build the static /trending response body once, in every encoding."""
+    github_static, hf_static, reddit_static = static_trending_models()
+    result = SearchResults(
+        github=list(github_static),
+        huggingface=list(hf_static),
+        reddit=list(reddit_static),
+        generated_queries=None,
+        synthesis="Explore trending projects, models, and discussions. Loading fresh data...",
+        search_duration_ms=0,
+        errors=[]
+    )
+    body = orjson.dumps(result.model_dump())
+    
+    # Bodies keyed by Content-Encoding (None = identity). Compressed once,
+    # so Brotli can use its slowest, densest setting.
+    bodies = {
+        None: body,
+        "br": brotli.compress(body, quality=11),
+        "gzip": gzip.compress(body, compresslevel=9),
+    }
+    return bodies
+
+
+# Stale-while-revalidate state for /trending: the last good live result and
+# the refresh in flight, so concurrent misses share a single fetch
+TRENDING_REFRESH_SECONDS = 1800
+_trending_last_good: Optional[SearchResults] = None
+_trending_last_good_at = 0.0
+_trending_refresh: Optional[asyncio.Task] = None
+
+
+def refresh_trending_in_background():
+    """Start a live trending fetch unless one is running or the last one is fresh."""
+    global _trending_refresh
+    
+    if _trending_refresh is not None and not _trending_refresh.done():
+        return
+    if _trending_last_good is not None and time.time() - _trending_last_good_at < TRENDING_REFRESH_SECONDS:
+        return
+    _trending_refresh = asyncio.create_task(fetch_and_cache_real_trending())
+
+
 @app.get("/trending", response_model=SearchResults)
-async def get_trending():
+async def get_trending(request: Request):
     """
     Get trending content across GitHub, HuggingFace, and Reddit.
     Returns curated, up-to-date projects and discussions with aggressive caching.
     Uses static fallback for instant loading while fetching fresh data in background.
     """
-    from datetime import datetime
-    from static_trending import STATIC_TRENDING
-    import asyncio
-    
     start_time = time.time()
     cache = get_cache()
     
@@ -264,39 +336,28 @@ async def get_trending():
         cached_trending["search_duration_ms"] = int((time.time() - start_time) * 1000)
         return SearchResults(**cached_trending)
     
-    # Check if we have static data as fallback
+    # Serve stale data immediately and revalidate in the background
+    refresh_trending_in_background()
+    
+    if _trending_last_good is not None:
+        print("🎯 Returning last known trending content")
+        return _trending_last_good
+    
+    # Nothing live yet: fall back to the static payload
     try:
-        # Parse static data into proper models
-        from models import GitHubResult, HuggingFaceResult, RedditResult, RedditComment
-        
-        github_static = [GitHubResult(**item) for item in STATIC_TRENDING["github"]]
-        hf_static = [HuggingFaceResult(**item) for item in STATIC_TRENDING["huggingface"]]
-        reddit_static = []
-        for item in STATIC_TRENDING["reddit"]:
-            reddit_data = item.copy()
-            if reddit_data.get("top_comments"):
-                reddit_data["top_comments"] = [RedditComment(**c) for c in reddit_data["top_comments"]]
-            reddit_static.append(RedditResult(**reddit_data))
-        
-        # Return static data immediately
-        static_result = SearchResults(
-            github=github_static,
-            huggingface=hf_static,
-            reddit=reddit_static,
-            generated_queries=None,
-            synthesis=f"Explore trending projects, models, and discussions. Loading fresh data...",
-            search_duration_ms=int((time.time() - start_time) * 1000),
-            errors=[]
+        # Static payload is built and encoded once, then served verbatim
+        static_bodies = static_trending_payload()
+        
+        encoding = choose_encoding(request.headers.get("accept-encoding", ""), STATIC_ENCODINGS)
+        headers = {"Vary": "Accept-Encoding"}
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return Response(
+            content=static_bodies[encoding],
+            media_type="application/json",
+            headers=headers
         )
         
-        # Cache static data briefly (1 minute) so repeated calls are instant
-        await cache.set("trending", "latest", static_result.model_dump(), ttl_seconds=60)
-        
-        # Start background task to fetch real data (don't await)
-        asyncio.create_task(fetch_and_cache_real_trending())
-        
-        return static_result
-        
     except Exception as e:
         print(f"⚠️ Static fallback failed: {e}")
     
@@ -306,8 +367,20 @@ async def get_trending():
 
 async def fetch_and_cache_real_trending():
     """Background task to fetch real trending data and cache it."""
+    global _trending_last_good, _trending_last_good_at
+    
     try:
         result = await fetch_real_trending()
+        
+        # Keep serving the previous data (here and in Redis) if this fetch
+        # came back empty, e.g. when every search failed
+        if not (result.github or result.huggingface or result.reddit):
+            print(f"⚠️ Background trending fetch returned nothing: {result.errors}")
+            return
+        
+        _trending_last_good = result
+        _trending_last_good_at = time.time()
+        
         cache = get_cache()
         # Cache for 30 minutes
         await cache.set("trending", "latest", result.model_dump(), ttl_seconds=1800)
@@ -437,4 +510,4 @@ async def test_search():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True, server_header=False)
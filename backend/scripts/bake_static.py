@@ -0,0 +1,105 @@
+"""Bake trending_data/*.json into the pickle artifacts loaded by static_trending.
+
+Run from the backend directory after editing any of the JSON sources:
+
+    python scripts/bake_static.py
+
+Use --check (e.g. in CI) to fail without writing anything when an artifact
+is out of date with its JSON source.
+"""
+import argparse
+import pickle
+import sys
+from array import array
+from datetime import datetime
+from pathlib import Path
+
+import orjson
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from static_trending import DATA_DIR, NUMERIC_COLUMNS, SOURCES
+
+
+def rank(records: list[dict], column: str) -> array:
+    """Record indices ordered by a numeric column, largest first."""
+    order = sorted(range(len(records)), key=lambda i: -(records[i].get(column) or 0))
+    return array("I", order)
+
+
+def check_unique(source: str, records: list[dict]):
+    """Refuse to bake a source that lists the same URL twice."""
+    seen = set()
+    for record in records:
+        if record["url"] in seen:
+            raise ValueError(f"Duplicate {source} record: {record['url']}")
+        seen.add(record["url"])
+
+
+def flatten_top_comment(record: dict) -> dict:
+    """Merge a Reddit record's single top comment into top_comment_* fields."""
+    comments = record.pop("top_comments", None) or [{}]
+    if len(comments) > 1:
+        raise ValueError(f"Only one top comment is kept per record: {record['url']}")
+    
+    comment = comments[0]
+    for field in ("author", "score", "body", "sentiment"):
+        record[f"top_comment_{field}"] = comment.get(field)
+    return record
+
+
+def epoch_timestamp(record: dict) -> dict:
+    """Replace a GitHub record's ISO last_updated string with epoch seconds."""
+    last_updated = record.pop("last_updated", None)
+    record["last_updated_ts"] = (
+        int(datetime.fromisoformat(last_updated.replace("Z", "+00:00")).timestamp())
+        if last_updated else None
+    )
+    return record
+
+
+def freeze(value):
+    """Turn every list nested in a record into a tuple."""
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, dict):
+        return {key: freeze(item) for key, item in value.items()}
+    return value
+
+
+def bake(source: str) -> bytes:
+    """Serialize one source's records and rankings as a protocol 5 pickle."""
+    records = orjson.loads((DATA_DIR / f"{source}.json").read_bytes())
+    check_unique(source, records)
+    if source == "github":
+        records = [epoch_timestamp(record) for record in records]
+    if source == "reddit":
+        records = [flatten_top_comment(record) for record in records]
+    records = [freeze(record) for record in records]
+    rankings = {column: rank(records, column) for column in NUMERIC_COLUMNS[source]}
+    return pickle.dumps({"records": records, "rankings": rankings}, protocol=5)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="only verify the artifacts are up to date")
+    args = parser.parse_args()
+    
+    stale = []
+    for source in SOURCES:
+        path = DATA_DIR / f"{source}.pkl"
+        baked = bake(source)
+        if args.check:
+            if not path.exists() or path.read_bytes() != baked:
+                stale.append(path.name)
+            continue
+        path.write_bytes(baked)
+        print(f"✅ Baked {path.name}")
+    
+    if stale:
+        print(f"❌ Stale artifacts: {', '.join(stale)} (run python scripts/bake_static.py)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,18 @@
 """Core search logic with parallel execution for GitHub, HuggingFace, and Reddit."""
 import asyncio
+import io
+import os
 import random
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import quote_plus, urlparse
 
 import httpx
+import ijson
+import orjson
 from bs4 import BeautifulSoup
 from ddgs import DDGS
 
@@ -58,52 +64,68 @@ def run_ddg_search(query: str, max_results: int, time_filter: str = "w") -> list
         return []
 
 
+# The ddgs client is synchronous, so it runs in a dedicated pool kept apart
+# from the default executor (used by content extraction). Each search uses
+# three threads and several searches (plus the trending refresh) can be in
+# flight at once, so the pool is sized for concurrent requests.
+_DDG_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="ddg"
+)
+
+
+async def ddg_search(query: str, max_results: int, time_filter: str = "w") -> list[dict]:
+    """Run a DuckDuckGo search without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_DDG_EXECUTOR, run_ddg_search, query, max_results, time_filter)
+
+
 # ============================================================================
 # GitHub Search & Parsing
 # ============================================================================
 
+# Repo landing pages only (not issues, pulls, wikis, etc.)
+_REPO_PATTERN = re.compile(r"github\.com/([^/]+)/([^/]+)/?$")
+_BAD_GH_PATH = re.compile(r"/(blob|tree|issues|pull|wiki|discussions|actions)/")
+
+# Markdown punctuation to drop and runs of blank lines to collapse. A run may
+# have punctuation between its newlines (e.g. a "***" rule), since that is
+# removed too.
+_MD_CLEAN = re.compile(r"\n(?:[#*`\[\]]*\n){2,}|[#*`\[\]]")
+
+
+def _md_clean_repl(match: re.Match) -> str:
+    """Collapse blank-line runs to one blank line; drop markdown punctuation."""
+    return "\n\n" if match.group().startswith("\n") else ""
+
+
 async def search_github(query: str, max_results: int = 8) -> list[GitHubResult]:
     """Search GitHub via DuckDuckGo and enrich with metadata."""
     results = []
     
     try:
-        # Run search in thread pool to avoid blocking
         # Fetch 5x the results to ensure we get enough recent, quality ones after filtering
-        loop = asyncio.get_event_loop()
-        search_results = await loop.run_in_executor(
-            None, 
-            run_ddg_search, 
+        search_results = await ddg_search(
             f"site:github.com {query}",
             max_results * 5  # Increased from 3x to 5x for better filtering
         )
         
         # Filter to actual repo pages (not issues, pulls, wikis, etc.)
-        repo_pattern = re.compile(r"github\.com/([^/]+)/([^/]+)/?$")
         filtered = []
         seen_repos = set()
         
         for r in search_results:
             url = r.get("href", "")
-            # More comprehensive filtering
-            if (repo_pattern.search(url) and 
-                "/blob/" not in url and 
-                "/tree/" not in url and
-                "/issues/" not in url and
-                "/pull/" not in url and
-                "/wiki/" not in url and
-                "/discussions/" not in url and
-                "/actions/" not in url):
-                
+            match = _REPO_PATTERN.search(url)
+            if match and _BAD_GH_PATH.search(url) is None:
                 # Extract repo identifier to avoid duplicates
-                match = repo_pattern.search(url)
-                if match:
-                    repo_id = f"{match.group(1)}/{match.group(2)}".lower()
-                    if repo_id not in seen_repos:
-                        seen_repos.add(repo_id)
-                        filtered.append(r)
-                        
-                        if len(filtered) >= max_results * 2:
-                            break
+                repo_id = f"{match.group(1)}/{match.group(2)}".lower()
+                if repo_id not in seen_repos:
+                    seen_repos.add(repo_id)
+                    filtered.append(r)
+                    
+                    if len(filtered) >= max_results * 2:
+                        break
         
         # Fetch README previews in parallel
         async with httpx.AsyncClient(timeout=settings.request_timeout) as client:
@@ -145,18 +167,17 @@ async def enrich_github_result(client: httpx.AsyncClient, result: dict, query: s
     # Try to fetch README preview
     if owner and repo:
         try:
-            readme_url = f"https://raw.githubusercontent.com/{owner}/{repo}/main/README.md"
-            response = await client.get(readme_url, headers=get_headers())
-            
-            if response.status_code == 404:
-                readme_url = f"https://raw.githubusercontent.com/{owner}/{repo}/master/README.md"
-                response = await client.get(readme_url, headers=get_headers())
+            readme_content = None
+            for branch in ("main", "master"):
+                readme_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/README.md"
+                status_code, readme_content = await fetch_text_head(client, readme_url)
+                if status_code != 404:
+                    break
             
-            if response.status_code == 200:
-                readme_content = response.text[:1500]
+            if readme_content is not None:
+                readme_content = readme_content[:1500]
                 # Clean up markdown
-                readme_preview = re.sub(r"[#*`\[\]]", "", readme_content)
-                readme_preview = re.sub(r"\n{3,}", "\n\n", readme_preview)
+                readme_preview = _MD_CLEAN.sub(_md_clean_repl, readme_content)
                 github_result.readme_preview = readme_preview[:500]
         except Exception:
             pass
@@ -189,7 +210,7 @@ async def enrich_github_result(client: httpx.AsyncClient, result: dict, query: s
                 time_elem = soup.select_one("relative-time")
                 if time_elem and time_elem.get("datetime"):
                     try:
-                        last_update = datetime.fromisoformat(time_elem["datetime"].replace("Z", "+00:00"))
+                        last_update = _parse_iso(time_elem["datetime"])
                         github_result.last_updated = time_elem["datetime"]
                         github_result.status = determine_project_status(last_update)
                     except Exception:
@@ -201,6 +222,37 @@ async def enrich_github_result(client: httpx.AsyncClient, result: dict, query: s
     return github_result
 
 
+async def fetch_text_head(
+    client: httpx.AsyncClient, url: str, max_bytes: int = 2048
+) -> tuple[int, Optional[str]]:
+    """
+    Stream a URL and decode only its first max_bytes bytes.
+    
+    Returns the status code and the decoded text (None unless status is 200).
+    """
+    async with client.stream("GET", url, headers=get_headers()) as response:
+        if response.status_code != 200:
+            return response.status_code, None
+        
+        chunks = []
+        total = 0
+        async for chunk in response.aiter_bytes(chunk_size=max_bytes):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= max_bytes:
+                break
+        
+        return response.status_code, b"".join(chunks)[:max_bytes].decode("utf-8", errors="replace")
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC."""
+    if timestamp.endswith("Z"):
+        return datetime.fromisoformat(timestamp[:-1] + "+00:00")
+    return datetime.fromisoformat(timestamp)
+
+
 def determine_project_status(last_update: datetime) -> ProjectStatus:
     """Determine project status based on last update time."""
     now = datetime.now(last_update.tzinfo) if last_update.tzinfo else datetime.utcnow()
@@ -220,32 +272,45 @@ def determine_project_status(last_update: datetime) -> ProjectStatus:
 # Hugging Face Search & Parsing
 # ============================================================================
 
+# Common pipeline tags, paired with their space-separated search form
+_PIPELINE_TAGS = tuple((tag, tag.replace("-", " ")) for tag in [
+    "text-generation", "text2text-generation", "text-classification",
+    "token-classification", "question-answering", "summarization",
+    "translation", "conversational",
+    "image-classification", "image-segmentation", "object-detection",
+    "image-to-text", "text-to-image", "image-to-image",
+    "audio-classification", "audio-to-audio", "automatic-speech-recognition",
+    "text-to-speech", "voice-activity-detection",
+    "zero-shot-classification", "feature-extraction"
+])
+
+# Direct model/space URLs, and path segments that mark non-model pages
+_HF_PATTERN = re.compile(r"huggingface\.co/([^/]+/[^/]+|spaces/[^/]+/[^/]+)/?$")
+_BAD_HF_SEGS = ("/blog", "/docs", "/posts")
+_GOOD_HF_SEGS = ("/datasets", "/models", "/spaces")
+
+
 async def search_huggingface(query: str, max_results: int = 6) -> list[HuggingFaceResult]:
     """Search Hugging Face via DuckDuckGo."""
     results = []
     
     try:
-        # Run search in thread pool, fetch more results
-        loop = asyncio.get_event_loop()
-        search_results = await loop.run_in_executor(
-            None,
-            run_ddg_search,
+        # Fetch more results than needed to survive filtering
+        search_results = await ddg_search(
             f"site:huggingface.co {query}",
             max_results * 3
         )
         
-        # Filter to model/space pages (not blog posts, docs, etc.)
-        hf_pattern = re.compile(r"huggingface\.co/([^/]+/[^/]+|spaces/[^/]+/[^/]+)/?$")
-        
         seen_urls = set()
         for r in search_results:
             url = r.get("href", "")
+            url_lower = url.lower()
             
             # Skip blog, docs, and other non-model pages
-            if ("/blog" in url or "/docs" in url or "/posts" in url or 
-                "/datasets" not in url and "/models" not in url and "/spaces" not in url):
+            if (any(seg in url_lower for seg in _BAD_HF_SEGS) or
+                    not any(seg in url_lower for seg in _GOOD_HF_SEGS)):
                 # Only include direct model/space URLs
-                if not hf_pattern.search(url):
+                if not _HF_PATTERN.search(url):
                     continue
             
             if url not in seen_urls:
@@ -255,33 +320,19 @@ async def search_huggingface(query: str, max_results: int = 6) -> list[HuggingFa
                 description = r.get("body", "")
                 
                 # Determine if it's a space
-                is_space = "/spaces/" in url.lower()
+                is_space = "/spaces/" in url_lower
                 spaces_url = url if is_space else None
                 
                 # Try to determine pipeline tag from URL or description
-                pipeline_tag = None
                 model_type = None
                 
-                # Common pipeline tags
-                pipeline_tags = [
-                    "text-generation", "text2text-generation", "text-classification",
-                    "token-classification", "question-answering", "summarization",
-                    "translation", "conversational",
-                    "image-classification", "image-segmentation", "object-detection",
-                    "image-to-text", "text-to-image", "image-to-image",
-                    "audio-classification", "audio-to-audio", "automatic-speech-recognition",
-                    "text-to-speech", "voice-activity-detection",
-                    "zero-shot-classification", "feature-extraction"
-                ]
-                
                 desc_lower = description.lower()
-                url_lower = url.lower()
                 
-                for tag in pipeline_tags:
-                    tag_search = tag.replace("-", " ")
-                    if tag_search in desc_lower or tag in url_lower:
-                        pipeline_tag = tag
-                        break
+                pipeline_tag = next(
+                    (tag for tag, tag_search in _PIPELINE_TAGS
+                     if tag_search in desc_lower or tag in url_lower),
+                    None,
+                )
                 
                 results.append(HuggingFaceResult(
                     title=title or "Unknown Model",
@@ -337,22 +388,24 @@ POSITIVE_PATTERNS = [
 ]
 
 
+# All patterns of each list fused into one alternation so text is scanned once;
+# each pattern is its own capturing group, so match.lastindex identifies it.
+_NEGATIVE_RE = re.compile("|".join(f"({p})" for p in NEGATIVE_PATTERNS))
+_POSITIVE_RE = re.compile("|".join(f"({p})" for p in POSITIVE_PATTERNS))
+
+
 def analyze_sentiment(text: str) -> tuple[SentimentType, Optional[str]]:
     """Analyze text for sentiment and return warning reason if negative."""
     text_lower = text.lower()
     
-    negative_matches = []
-    positive_count = 0
-    
-    for pattern in NEGATIVE_PATTERNS:
-        if re.search(pattern, text_lower):
-            match = re.search(pattern, text_lower)
-            if match:
-                negative_matches.append(match.group())
+    # First hit of each negative pattern, in pattern-list order
+    negative_hits = {}
+    for match in _NEGATIVE_RE.finditer(text_lower):
+        negative_hits.setdefault(match.lastindex, match.group())
+    negative_matches = [negative_hits[i] for i in sorted(negative_hits)]
     
-    for pattern in POSITIVE_PATTERNS:
-        if re.search(pattern, text_lower):
-            positive_count += 1
+    # Number of distinct positive patterns present
+    positive_count = len({match.lastindex for match in _POSITIVE_RE.finditer(text_lower)})
     
     if len(negative_matches) >= 2:
         return SentimentType.NEGATIVE, f"Community concerns: {', '.join(negative_matches[:3])}"
@@ -364,16 +417,17 @@ def analyze_sentiment(text: str) -> tuple[SentimentType, Optional[str]]:
         return SentimentType.NEUTRAL, None
 
 
+# Trailing " : r/sub" or " - Reddit" suffix on DuckDuckGo result titles
+_RD_TITLE_CLEAN = re.compile(r"(?:\s*:\s*r/\w+|\s*[-–]\s*Reddit)\s*$")
+
+
 async def search_reddit(query: str, max_results: int = 6) -> list[RedditResult]:
     """Search Reddit via DuckDuckGo and fetch thread data via .json hack."""
     results = []
     
     try:
-        # Run search in thread pool, fetch more results
-        loop = asyncio.get_event_loop()
-        search_results = await loop.run_in_executor(
-            None,
-            run_ddg_search,
+        # Fetch more results than needed to survive filtering
+        search_results = await ddg_search(
             f"site:reddit.com {query}",
             max_results * 4  # Fetch extra since some may be comments/invalid
         )
@@ -398,16 +452,14 @@ async def search_reddit(query: str, max_results: int = 6) -> list[RedditResult]:
                 
                 if base_url not in seen_urls:
                     seen_urls.add(base_url)
-                    r_copy = r.copy()
-                    r_copy["href"] = base_url
-                    filtered.append(r_copy)
+                    filtered.append((base_url, r.get("title", "Reddit Discussion")))
                     
                     if len(filtered) >= max_results * 2:
                         break
         
         # Fetch thread JSON data in parallel
         async with httpx.AsyncClient(timeout=settings.request_timeout) as client:
-            tasks = [fetch_reddit_thread(client, r) for r in filtered]
+            tasks = [fetch_reddit_thread(client, url, title) for url, title in filtered]
             results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Filter out exceptions and limit
@@ -419,18 +471,45 @@ async def search_reddit(query: str, max_results: int = 6) -> list[RedditResult]:
     return results
 
 
-async def fetch_reddit_thread(client: httpx.AsyncClient, result: dict) -> RedditResult:
-    """Fetch Reddit thread data using the .json URL hack."""
-    url = result.get("href", "")
-    title = result.get("title", "Reddit Discussion")
+# Thread payloads at least this large are parsed incrementally
+_STREAM_PARSE_MIN_BYTES = 64 * 1024
+
+
+def load_reddit_thread_json(content: bytes, max_comments: int = 10) -> list:
+    """
+    Decode a Reddit thread .json payload into its [post, comments] listings.
+    
+    Small payloads are parsed whole. Large ones (e.g. when Reddit ignores the
+    limit/depth params) are parsed incrementally, stopping after max_comments
+    comment entries so the rest of the comment tree is never built.
+    """
+    if len(content) < _STREAM_PARSE_MIN_BYTES:
+        return orjson.loads(content)
+    
+    posts = []
+    comments = []
+    for child in ijson.items(io.BytesIO(content), "item.data.children.item", use_float=True):
+        if child.get("kind") == "t3":
+            posts.append(child)
+        else:
+            comments.append(child)
+            if len(comments) >= max_comments:
+                break
     
+    return [
+        {"data": {"children": posts}},
+        {"data": {"children": comments}},
+    ]
+
+
+async def fetch_reddit_thread(client: httpx.AsyncClient, url: str, title: str) -> RedditResult:
+    """Fetch Reddit thread data using the .json URL hack."""
     # Extract subreddit from URL
     subreddit_match = re.search(r"reddit\.com/r/([^/]+)/", url)
     subreddit = subreddit_match.group(1) if subreddit_match else "unknown"
     
     # Clean title
-    title = re.sub(r"\s*:\s*r/\w+\s*$", "", title)
-    title = re.sub(r"\s*[-–]\s*Reddit\s*$", "", title)
+    title = _RD_TITLE_CLEAN.sub("", title)
     
     reddit_result = RedditResult(
         title=title,
@@ -440,14 +519,14 @@ async def fetch_reddit_thread(client: httpx.AsyncClient, result: dict) -> Reddit
     
     # Try to fetch JSON data
     try:
-        # Clean URL and add .json
+        # Clean URL and add .json, trimmed to the top-level comments we read
         clean_url = url.split("?")[0].rstrip("/")
-        json_url = f"{clean_url}.json"
+        json_url = f"{clean_url}.json?limit=10&depth=1&raw_json=1&sort=top"
         
         response = await client.get(json_url, headers=get_headers(), follow_redirects=True)
         
         if response.status_code == 200:
-            data = response.json()
+            data = load_reddit_thread_json(response.content)
             
             if isinstance(data, list) and len(data) >= 1:
                 # First element is the post
@@ -4,131 +4,247 @@ Enterprise-grade security implementation
 """
 
 from fastapi import Request, HTTPException, status
-from fastapi.responses import JSONResponse
-from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from upstash_redis.asyncio import Redis
+from upstash_redis.errors import UpstashError
+import orjson
+import asyncio
+from collections import OrderedDict
 from datetime import datetime, timedelta
-import secrets
+import base64
 import hashlib
+import hmac
+import os
 import re
+import string
+import threading
 from typing import Optional
 import time
 
+from compression import CompressionMiddleware
+from config import get_settings
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+
+# Error bodies are constant, so they are serialized once at import
+RATE_LIMITED_BODY = orjson.dumps({
+    "detail": "Too many requests. Please try again later.",
+    "retry_after": 60
+})
+INPUT_REJECTED_BODY = orjson.dumps({
+    "detail": "Invalid input detected. Request blocked for security."
+})
+
+
+# Content Security Policy - Strict CSP
+CONTENT_SECURITY_POLICY = b"; ".join([
+    b"default-src 'self'",
+    b"script-src 'self' 'unsafe-inline' 'unsafe-eval' https://vercel.live",
+    b"style-src 'self' 'unsafe-inline' https://fonts.googleapis.com",
+    b"font-src 'self' https://fonts.gstatic.com data:",
+    b"img-src 'self' data: https: blob:",
+    b"connect-src 'self' https://api.groq.com https://generativelanguage.googleapis.com",
+    b"frame-ancestors 'none'",
+    b"base-uri 'self'",
+    b"form-action 'self'",
+    b"upgrade-insecure-requests"
+])
+
+# Permissions Policy - Restrict browser features
+PERMISSIONS_POLICY = b", ".join([
+    b"accelerometer=()",
+    b"camera=()",
+    b"geolocation=()",
+    b"gyroscope=()",
+    b"magnetometer=()",
+    b"microphone=(self)",  # Allow microphone for voice input
+    b"payment=()",
+    b"usb=()"
+])
+
+# Raw ASGI header pairs, so nothing is encoded per response
+SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    # Prevent clickjacking attacks
+    (b"x-frame-options", b"DENY"),
+    # Prevent MIME type sniffing
+    (b"x-content-type-options", b"nosniff"),
+    # Enable XSS protection
+    (b"x-xss-protection", b"1; mode=block"),
+    # Referrer policy - only send origin on cross-origin requests
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"content-security-policy", CONTENT_SECURITY_POLICY),
+    (b"permissions-policy", PERMISSIONS_POLICY),
+)
+
+# Strict Transport Security - Force HTTPS (only in production)
+HSTS_HEADER = (b"strict-transport-security", b"max-age=31536000; includeSubDomains; preload")
+
+
+class SecurityHeadersMiddleware:
     """Add comprehensive security headers to all responses."""
     
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        
-        # Prevent clickjacking attacks
-        response.headers["X-Frame-Options"] = "DENY"
-        
-        # Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        
-        # Enable XSS protection
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        
-        # Referrer policy - only send origin on cross-origin requests
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        
-        # Content Security Policy - Strict CSP
-        csp_directives = [
-            "default-src 'self'",
-            "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://vercel.live",
-            "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com",
-            "font-src 'self' https://fonts.gstatic.com data:",
-            "img-src 'self' data: https: blob:",
-            "connect-src 'self' https://api.groq.com https://generativelanguage.googleapis.com",
-            "frame-ancestors 'none'",
-            "base-uri 'self'",
-            "form-action 'self'",
-            "upgrade-insecure-requests"
-        ]
-        response.headers["Content-Security-Policy"] = "; ".join(csp_directives)
-        
-        # Permissions Policy - Restrict browser features
-        permissions_policy = [
-            "accelerometer=()",
-            "camera=()",
-            "geolocation=()",
-            "gyroscope=()",
-            "magnetometer=()",
-            "microphone=(self)",  # Allow microphone for voice input
-            "payment=()",
-            "usb=()"
-        ]
-        response.headers["Permissions-Policy"] = ", ".join(permissions_policy)
-        
-        # Strict Transport Security - Force HTTPS (only in production)
-        if request.url.scheme == "https":
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains; preload"
-        
-        # Remove server identification
-        response.headers.pop("Server", None)
+    _hdr_common = SECURITY_HEADERS
+    _hdr_https = SECURITY_HEADERS + (HSTS_HEADER,)
+    
+    # Header names set here replace any the app set. The Server header is
+    # added by uvicorn itself and is disabled there (server_header=False).
+    _replaced = frozenset(name for name, _ in _hdr_https)
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start":
+                # scope["scheme"] is already "http"/"https"; no URL parsing needed
+                extra = self._hdr_https if scope["scheme"] == "https" else self._hdr_common
+                
+                # Set all headers in one pass over the raw header list
+                headers = [
+                    header for header in message.get("headers", ())
+                    if header[0] not in self._replaced
+                ]
+                headers.extend(extra)
+                message["headers"] = headers
+            await send(message)
         
-        return response
+        await self.app(scope, receive, send_with_headers)
+
+
+# Atomically read both windows' counts and, only if the request is under the
+# limit, count it, so the whole rate-limit check is one Redis round trip.
+# Rejected requests are not counted, matching the in-process counters.
+# ARGV: key TTL, limit, weight of the previous window. Returns the counts
+# from before this request.
+RATE_LIMIT_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local total = math.floor(previous * tonumber(ARGV[3])) + current
+if total < tonumber(ARGV[2]) then
+    if redis.call('INCR', KEYS[1]) == 1 then
+        redis.call('EXPIRE', KEYS[1], ARGV[1])
+    end
+end
+return {current, previous}
+"""
+RATE_LIMIT_SCRIPT_SHA = hashlib.sha1(RATE_LIMIT_SCRIPT.encode()).hexdigest()
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """Rate limiting to prevent abuse and DDoS attacks."""
     
+    # Cap on IPs tracked in process
+    MAX_TRACKED_IPS = 100_000
+    
+    # Redis is on the request path: fail fast, then skip it for a while
+    REDIS_TIMEOUT_SECONDS = 0.5
+    REDIS_COOLDOWN_SECONDS = 30
+    
     def __init__(self, app, requests_per_minute: int = 60):
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
-        self.request_counts = {}  # {ip: [(timestamp, count), ...]}
-        self.cleanup_interval = 60  # Clean up old entries every 60 seconds
-        self.last_cleanup = time.time()
+        self.window_seconds = 60
+        
+        # Shared counters in Redis keep the limit consistent across workers
+        settings = get_settings()
+        self.redis: Optional[Redis] = None
+        if settings.upstash_redis_url and settings.upstash_redis_token:
+            self.redis = Redis(
+                url=settings.upstash_redis_url,
+                token=settings.upstash_redis_token,
+                rest_retries=0
+            )
+        # Redis is not tried again before this time after a failure
+        self.redis_retry_at = 0.0
+        
+        # In-process fallback when Redis is not configured or unreachable.
+        # Stale windows are rolled over when an IP is next seen, and the
+        # least recently seen IPs are evicted once the cap is reached.
+        self.counters: OrderedDict[str, list[int]] = OrderedDict()  # {ip: [window, current, previous]}
     
-    def _cleanup_old_entries(self):
-        """Remove entries older than 1 minute."""
-        current_time = time.time()
-        if current_time - self.last_cleanup > self.cleanup_interval:
-            cutoff_time = current_time - 60
-            for ip in list(self.request_counts.keys()):
-                self.request_counts[ip] = [
-                    (ts, count) for ts, count in self.request_counts[ip]
-                    if ts > cutoff_time
-                ]
-                if not self.request_counts[ip]:
-                    del self.request_counts[ip]
-            self.last_cleanup = current_time
+    def _local_entry(self, client_ip: str, window: int) -> list[int]:
+        """Return the [window, current, previous] counter for an IP, rolled to window."""
+        entry = self.counters.get(client_ip)
+        if entry is None:
+            entry = self.counters[client_ip] = [window, 0, 0]
+            if len(self.counters) > self.MAX_TRACKED_IPS:
+                self.counters.popitem(last=False)
+            return entry
+        
+        # Mutated in place, so steady-state requests allocate nothing
+        self.counters.move_to_end(client_ip)
+        if entry[0] != window:
+            entry[2] = entry[1] if entry[0] == window - 1 else 0
+            entry[1] = 0
+            entry[0] = window
+        return entry
+    
+    async def _evalsha(self, keys: list[str], args: list) -> list:
+        """Run the rate-limit script, loading it first if Redis lost it."""
+        try:
+            return await self.redis.evalsha(RATE_LIMIT_SCRIPT_SHA, keys=keys, args=args)
+        except UpstashError as e:
+            # Script not cached yet (first call or Redis restart)
+            if "NOSCRIPT" not in str(e):
+                raise
+        await self.redis.script_load(RATE_LIMIT_SCRIPT)
+        return await self.redis.evalsha(RATE_LIMIT_SCRIPT_SHA, keys=keys, args=args)
+    
+    async def _redis_counts(self, client_ip: str, window: int, weight: float) -> Optional[tuple[int, int]]:
+        """Record an allowed hit in Redis and return (previous, current) counts before it."""
+        keys = [f"rl:{client_ip}:{window}", f"rl:{client_ip}:{window - 1}"]
+        # Keep each window readable through the next one
+        args = [self.window_seconds * 2, self.requests_per_minute, repr(weight)]
+        try:
+            current, previous = await asyncio.wait_for(
+                self._evalsha(keys, args), timeout=self.REDIS_TIMEOUT_SECONDS
+            )
+            return int(previous), int(current)
+        except Exception as e:
+            print(f"⚠️ Redis rate limit error, using in-process counters for {self.REDIS_COOLDOWN_SECONDS}s: {e!r}")
+            self.redis_retry_at = time.time() + self.REDIS_COOLDOWN_SECONDS
+            return None
     
     async def dispatch(self, request: Request, call_next):
         # Get client IP
         client_ip = request.client.host if request.client else "unknown"
         
-        # Cleanup old entries periodically
-        self._cleanup_old_entries()
-        
-        # Initialize or get request count for this IP
         current_time = time.time()
-        if client_ip not in self.request_counts:
-            self.request_counts[client_ip] = []
+        window = int(current_time // self.window_seconds)
         
-        # Count requests in the last minute
-        recent_requests = [
-            (ts, count) for ts, count in self.request_counts[client_ip]
-            if current_time - ts < 60
-        ]
-        total_requests = sum(count for _, count in recent_requests)
+        # Approximate sliding window: weight the previous window's count by
+        # how much of it still overlaps the last 60 seconds
+        elapsed = (current_time % self.window_seconds) / self.window_seconds
+        weight = 1 - elapsed
+        
+        counts = None
+        if self.redis is not None and current_time >= self.redis_retry_at:
+            counts = await self._redis_counts(client_ip, window, weight)
+        
+        entry = None
+        if counts is None:
+            entry = self._local_entry(client_ip, window)
+            counts = (entry[2], entry[1])
+        previous_count, current_count = counts
+        total_requests = int(previous_count * weight) + current_count
         
         # Check rate limit
         if total_requests >= self.requests_per_minute:
-            return JSONResponse(
+            return Response(
+                content=RATE_LIMITED_BODY,
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                content={
-                    "detail": "Too many requests. Please try again later.",
-                    "retry_after": 60
-                },
+                media_type="application/json",
                 headers={"Retry-After": "60"}
             )
         
-        # Record this request
-        self.request_counts[client_ip] = recent_requests + [(current_time, 1)]
+        # Record this request (the Redis script already counted it if allowed)
+        if entry is not None:
+            entry[1] += 1
         
         response = await call_next(request)
         
@@ -140,51 +256,113 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         return response
 
 
-class InputValidationMiddleware(BaseHTTPMiddleware):
+class _InputRejected(Exception):
+    """Raised from the wrapped receive() to stop the app reading a rejected body."""
+
+
+class InputValidationMiddleware:
     """Validate and sanitize all input data."""
     
     # Dangerous patterns to detect
     DANGEROUS_PATTERNS = [
-        r'<script[^>]*>.*?</script>',  # XSS
-        r'javascript:',  # JavaScript protocol
-        r'on\w+\s*=',  # Event handlers
-        r'<iframe[^>]*>',  # iFrames
-        r'<object[^>]*>',  # Objects
-        r'<embed[^>]*>',  # Embeds
-        r'\bexec\b',  # SQL exec
-        r'\bDROP\s+TABLE\b',  # SQL DROP
-        r'\bUNION\s+SELECT\b',  # SQL injection
-        r'\.\./\.\.',  # Path traversal
-        r'[;\|&]',  # Command injection
+        rb'<script[^>]*>.*?</script>',  # XSS
+        rb'javascript:',  # JavaScript protocol
+        rb'on\w+\s*=',  # Event handlers
+        rb'<iframe[^>]*>',  # iFrames
+        rb'<object[^>]*>',  # Objects
+        rb'<embed[^>]*>',  # Embeds
+        rb'\bexec\b',  # SQL exec
+        rb'\bDROP\s+TABLE\b',  # SQL DROP
+        rb'\bUNION\s+SELECT\b',  # SQL injection
+        rb'\.\./\.\.',  # Path traversal
+        rb'[;\|&]',  # Command injection
     ]
     
-    async def dispatch(self, request: Request, call_next):
+    # All patterns fused into one alternation so the body is scanned once,
+    # directly on the raw bytes (no UTF-8 decode)
+    _DANGEROUS_RE = re.compile(
+        b"|".join(b"(?:" + p + b")" for p in DANGEROUS_PATTERNS),
+        re.IGNORECASE | re.DOTALL
+    )
+    
+    # Bytes carried over from the previous chunk so patterns straddling a
+    # chunk boundary are still caught
+    SCAN_OVERLAP = 1024
+    
+    # Binary payloads the text patterns are meaningless for
+    UNSCANNED_CONTENT_TYPES = (
+        b"multipart/form-data",
+        b"application/octet-stream",
+        b"image/",
+        b"audio/",
+        b"video/",
+    )
+    
+    # Endpoints that take no user input
+    SKIPPED_PATHS = frozenset({"/", "/health", "/metrics"})
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         # Only validate POST/PUT/PATCH requests with body
-        if request.method in ["POST", "PUT", "PATCH"]:
-            try:
-                # Read and validate body
-                body = await request.body()
-                body_str = body.decode('utf-8')
-                
-                # Check for dangerous patterns
-                for pattern in self.DANGEROUS_PATTERNS:
-                    if re.search(pattern, body_str, re.IGNORECASE):
-                        return JSONResponse(
-                            status_code=status.HTTP_400_BAD_REQUEST,
-                            content={"detail": "Invalid input detected. Request blocked for security."}
-                        )
-                
-                # Recreate request with validated body
-                async def receive():
-                    return {"type": "http.request", "body": body}
-                
-                request._receive = receive
-                
-            except Exception:
-                pass  # If body parsing fails, let it through (FastAPI will handle)
-        
-        response = await call_next(request)
-        return response
+        if (scope["type"] != "http"
+                or scope["method"] not in ("POST", "PUT", "PATCH")
+                or scope["path"] in self.SKIPPED_PATHS):
+            await self.app(scope, receive, send)
+            return
+        
+        # Pass binary uploads straight through; anything else, including a
+        # missing content type (FastAPI then parses the body as JSON), is scanned
+        content_type = next((value for name, value in scope["headers"] if name == b"content-type"), b"")
+        if content_type.lower().startswith(self.UNSCANNED_CONTENT_TYPES):
+            await self.app(scope, receive, send)
+            return
+        
+        # Scan the body chunk by chunk as the app reads it instead of
+        # buffering it up front
+        tail = b""
+        blocked = False
+        response_started = False
+        
+        async def scanning_receive() -> Message:
+            nonlocal tail, blocked
+            message = await receive()
+            if message["type"] == "http.request":
+                data = tail + message.get("body", b"")
+                if self._DANGEROUS_RE.search(data):
+                    blocked = True
+                    raise _InputRejected()
+                tail = data[-self.SCAN_OVERLAP:]
+            return message
+        
+        async def guarded_send(message: Message):
+            nonlocal response_started
+            # Once the body is rejected, drop whatever error the app produces
+            if blocked:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, scanning_receive, guarded_send)
+        except Exception:
+            if not blocked:
+                raise
+        
+        if blocked and not response_started:
+            response = Response(
+                content=INPUT_REJECTED_BODY,
+                status_code=status.HTTP_400_BAD_REQUEST,
+                media_type="application/json"
+            )
+            await response(scope, receive, send)
+
+
+# Deletion tables for allowed API key characters; anything left over is invalid
+_GROQ_KEY_DEL = str.maketrans('', '', string.ascii_letters + string.digits + '_')
+_GEMINI_KEY_DEL = str.maketrans('', '', string.ascii_letters + string.digits + '_-')
 
 
 class APIKeyValidator:
@@ -205,7 +383,7 @@ class APIKeyValidator:
             return False
         
         # Check for valid characters (alphanumeric and underscore)
-        if not re.match(r'^[a-zA-Z0-9_]+$', api_key):
+        if api_key.translate(_GROQ_KEY_DEL):
             return False
         
         return True
@@ -220,7 +398,7 @@ class APIKeyValidator:
         if len(api_key) < 20:
             return False
         
-        if not re.match(r'^[a-zA-Z0-9_-]+$', api_key):
+        if api_key.translate(_GEMINI_KEY_DEL):
             return False
         
         return True
@@ -232,6 +410,20 @@ class APIKeyValidator:
         return re.sub(r'[^a-zA-Z0-9_-]', '', api_key)
 
 
+# Query sanitization patterns, compiled once
+_NULL_TABLE = str.maketrans('', '', '\x00')
+_TAG_RE = re.compile(r'<[^>]+>')
+_SQL_KEYWORDS = ('DROP', 'DELETE', 'INSERT', 'UPDATE', 'EXEC', 'UNION', 'SELECT', '--', ';--')
+_SQL_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, _SQL_KEYWORDS)) + r')\b',
+    re.IGNORECASE
+)
+_CMD_RE = re.compile(r'[;&|`$()]')
+
+# Characters any of the substitutions above could remove
+_SUSPICIOUS_CHARS = frozenset('<;&|`$()')
+
+
 class QuerySanitizer:
     """Sanitize user search queries to prevent injection attacks."""
     
@@ -245,21 +437,27 @@ class QuerySanitizer:
         query = query[:max_length]
         
         # Remove null bytes
-        query = query.replace('\x00', '')
+        query = query.translate(_NULL_TABLE)
         
         # Remove excessive whitespace
         query = ' '.join(query.split())
         
+        # Most queries contain nothing the patterns below would touch. ASCII
+        # only, since re.IGNORECASE folds a few non-ASCII letters that
+        # str.upper() does not.
+        if query.isascii() and _SUSPICIOUS_CHARS.isdisjoint(query):
+            upper = query.upper()
+            if not any(keyword in upper for keyword in _SQL_KEYWORDS):
+                return query
+        
         # Remove dangerous HTML/script tags
-        query = re.sub(r'<[^>]+>', '', query)
+        query = _TAG_RE.sub('', query)
         
         # Remove SQL injection attempts
-        dangerous_sql = ['DROP', 'DELETE', 'INSERT', 'UPDATE', 'EXEC', 'UNION', 'SELECT', '--', ';--']
-        for term in dangerous_sql:
-            query = re.sub(rf'\b{term}\b', '', query, flags=re.IGNORECASE)
+        query = _SQL_RE.sub('', query)
         
         # Remove command injection attempts
-        query = re.sub(r'[;&|`$()]', '', query)
+        query = _CMD_RE.sub('', query)
         
         return query.strip()
     
@@ -269,25 +467,65 @@ class QuerySanitizer:
         return min_length <= len(query) <= max_length
 
 
+class _EntropyPool:
+    """Hands out OS CSPRNG bytes from a buffer refilled one page at a time."""
+    
+    def __init__(self, chunk_size: int = 4096):
+        self._chunk_size = chunk_size
+        self._reset()
+        # A forked child must not hand out the bytes its parent already holds
+        # (e.g. workers forked after a preload); os.register_at_fork is POSIX only
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset)
+    
+    def _reset(self):
+        """Drop any buffered bytes; the lock is recreated in case a fork copied it held."""
+        self._buf = b""
+        self._pos = 0
+        self._lock = threading.Lock()
+    
+    def get(self, nbytes: int) -> bytes:
+        """Return nbytes fresh random bytes; each byte is handed out only once."""
+        with self._lock:
+            if self._pos + nbytes > len(self._buf):
+                self._buf = os.urandom(max(self._chunk_size, nbytes))
+                self._pos = 0
+            data = self._buf[self._pos:self._pos + nbytes]
+            self._pos += nbytes
+            return data
+
+
+# One getrandom() call per ~128 CSRF tokens instead of one per token
+_csrf_entropy = _EntropyPool()
+
+
 class SecureHeaders:
     """Generate secure headers for responses."""
     
     @staticmethod
     def generate_csrf_token() -> str:
         """Generate a cryptographically secure CSRF token."""
-        return secrets.token_urlsafe(32)
+        # Same format as secrets.token_urlsafe(32)
+        return base64.urlsafe_b64encode(_csrf_entropy.get(32)).rstrip(b"=").decode("ascii")
     
     @staticmethod
     def hash_token(token: str) -> str:
-        """Hash a token using SHA-256."""
-        return hashlib.sha256(token.encode()).hexdigest()
+        """Hash a token using BLAKE2b with a 256-bit digest."""
+        # Tokens are high-entropy secrets, so BLAKE2b is as strong here as
+        # SHA-256 and faster in software
+        return hashlib.blake2b(token.encode(), digest_size=32).hexdigest()
+    
+    @staticmethod
+    def verify_token(token: str, token_hash: str) -> bool:
+        """Check a token against a stored hash in constant time."""
+        return hmac.compare_digest(SecureHeaders.hash_token(token), token_hash)
 
 
 def setup_security_middleware(app):
     """Configure all security middleware for the FastAPI app."""
     
-    # Add compression (before other middleware)
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    # Add compression (before other middleware): zstd, then Brotli, then gzip
+    app.add_middleware(CompressionMiddleware, minimum_size=1000)
     
     # Add rate limiting
     app.add_middleware(RateLimitMiddleware, requests_per_minute=60)
@@ -298,14 +536,8 @@ def setup_security_middleware(app):
     # Add security headers
     app.add_middleware(SecurityHeadersMiddleware)
     
-    # Add trusted host middleware (prevents host header attacks)
-    app.add_middleware(
-        TrustedHostMiddleware,
-        allowed_hosts=["localhost", "127.0.0.1", "*.vercel.app", "*.render.com"]
-    )
-    
-    # In production, redirect HTTP to HTTPS
-    # app.add_middleware(HTTPSRedirectMiddleware)  # Uncomment for production
+    # Host allow-listing and HTTP -> HTTPS redirects are enforced by the
+    # edge (Render / Vercel / nginx), see SECURITY-IMPLEMENTATION.md
     
     return app
 
@@ -1,448 +1,187 @@
 """Static fallback data for instant trending display - EXPANDED."""
+import pickle
+import sys
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
 
-STATIC_TRENDING = {
-    "github": [
-        {
-            "source": "github",
-            "title": "microsoft/vscode",
-            "url": "https://github.com/microsoft/vscode",
-            "description": "Visual Studio Code - Open Source (\"Code - OSS\")",
-            "stars": 163000,
-            "language": "TypeScript",
-            "last_updated": "2025-12-29T00:00:00Z",
-            "status": "active",
-            "clone_command": "git clone https://github.com/microsoft/vscode.git",
-            "readme_preview": "Visual Studio Code is a distribution of the Code - OSS repository with Microsoft specific customizations released under a traditional Microsoft product license.",
-            "topics": ["editor", "typescript", "electron"]
-        },
-        {
-            "source": "github",
-            "title": "vercel/next.js",
-            "url": "https://github.com/vercel/next.js",
-            "description": "The React Framework for Production",
-            "stars": 125000,
-            "language": "JavaScript",
-            "last_updated": "2025-12-29T00:00:00Z",
-            "status": "active",
-            "clone_command": "git clone https://github.com/vercel/next.js.git",
-            "readme_preview": "Next.js is a React framework for building full-stack web applications. You use React Components to build user interfaces, and Next.js for additional features and optimizations.",
-            "topics": ["react", "nextjs", "framework"]
-        },
-        {
-            "source": "github",
-            "title": "pytorch/pytorch",
-            "url": "https://github.com/pytorch/pytorch",
-            "description": "Tensors and Dynamic neural networks in Python with strong GPU acceleration",
-            "stars": 82000,
-            "language": "Python",
-            "last_updated": "2025-12-29T00:00:00Z",
-            "status": "active",
-            "clone_command": "git clone https://github.com/pytorch/pytorch.git",
-            "readme_preview": "PyTorch is a Python package that provides two high-level features: Tensor computation with strong GPU acceleration and Deep neural networks built on a tape-based autograd system.",
-            "topics": ["pytorch", "machine-learning", "deep-learning"]
-        },
-        {
-            "source": "github",
-            "title": "facebook/react",
-            "url": "https://github.com/facebook/react",
-            "description": "The library for web and native user interfaces",
-            "stars": 228000,
-            "language": "JavaScript",
-            "last_updated": "2025-12-29T00:00:00Z",
-            "status": "active",
-            "clone_command": "git clone https://github.com/facebook/react.git",
-            "readme_preview": "React is a JavaScript library for building user interfaces. It is maintained by Meta and a community of individual developers and companies.",
-            "topics": ["react", "javascript", "ui", "frontend"]
-        },
-        {
-            "source": "github",
-            "title": "openai/whisper",
-            "url": "https://github.com/openai/whisper",
-            "description": "Robust Speech Recognition via Large-Scale Weak Supervision",
-            "stars": 67000,
-            "language": "Python",
-            "last_updated": "2025-12-28T00:00:00Z",
-            "status": "active",
-            "clone_command": "git clone https://github.com/openai/whisper.git",
-            "readme_preview": "Whisper is a general-purpose speech recognition model trained on a large dataset of diverse audio.",
-            "topics": ["whisper", "speech-recognition", "ai", "openai"]
-        },
-        {
-            "source": "github",
-            "title": "microsoft/TypeScript",
-            "url": "https://github.com/microsoft/TypeScript",
-            "description": "TypeScript is a superset of JavaScript that compiles to clean JavaScript output",
-            "stars": 100000,
-            "language": "TypeScript",
-            "last_updated": "2025-12-29T00:00:00Z",
-            "status": "active",
-            "clone_command": "git clone https://github.com/microsoft/TypeScript.git",
-            "readme_preview": "TypeScript is a language for application-scale JavaScript with optional static type checking.",
-            "topics": ["typescript", "javascript", "compiler"]
-        },
-        {
-            "source": "github",
-            "title": "langchain-ai/langchain",
-            "url": "https://github.com/langchain-ai/langchain",
-            "description": "Build context-aware reasoning applications with LangChain",
-            "stars": 92000,
-            "language": "Python",
-            "last_updated": "2025-12-29T00:00:00Z",
-            "status": "active",
-            "clone_command": "git clone https://github.com/langchain-ai/langchain.git",
-            "readme_preview": "LangChain is a framework for developing applications powered by large language models.",
-            "topics": ["langchain", "llm", "ai", "agents"]
-        },
-        {
-            "source": "github",
-            "title": "tailwindlabs/tailwindcss",
-            "url": "https://github.com/tailwindlabs/tailwindcss",
-            "description": "A utility-first CSS framework for rapid UI development",
-            "stars": 82000,
-            "language": "CSS",
-            "last_updated": "2025-12-29T00:00:00Z",
-            "status": "active",
-            "clone_command": "git clone https://github.com/tailwindlabs/tailwindcss.git",
-            "readme_preview": "Tailwind CSS is a utility-first CSS framework for building custom user interfaces.",
-            "topics": ["tailwind", "css", "styling", "design"]
-        },
-        {
-            "source": "github",
-            "title": "ggerganov/llama.cpp",
-            "url": "https://github.com/ggerganov/llama.cpp",
-            "description": "LLM inference in C/C++",
-            "stars": 65000,
-            "language": "C++",
-            "last_updated": "2025-12-29T00:00:00Z",
-            "status": "active",
-            "clone_command": "git clone https://github.com/ggerganov/llama.cpp.git",
-            "readme_preview": "The main goal of llama.cpp is to enable LLM inference with minimal setup and state-of-the-art performance.",
-            "topics": ["llama", "cpp", "inference", "ai"]
-        },
-        {
-            "source": "github",
-            "title": "shadcn-ui/ui",
-            "url": "https://github.com/shadcn-ui/ui",
-            "description": "Beautifully designed components that you can copy and paste into your apps",
-            "stars": 71000,
-            "language": "TypeScript",
-            "last_updated": "2025-12-29T00:00:00Z",
-            "status": "active",
-            "clone_command": "git clone https://github.com/shadcn-ui/ui.git",
-            "readme_preview": "A collection of re-usable components built using Radix UI and Tailwind CSS.",
-            "topics": ["react", "ui", "components", "shadcn"]
-        }
-    ],
-    "huggingface": [
-        {
-            "source": "huggingface",
-            "title": "meta-llama/Llama-3.3-70B-Instruct",
-            "url": "https://huggingface.co/meta-llama/Llama-3.3-70B-Instruct",
-            "description": "Llama 3.3 multilingual large language model optimized for dialogue use cases",
-            "model_type": "text-generation",
-            "downloads": 500000,
-            "likes": 1200,
-            "spaces_url": None,
-            "pipeline_tag": "text-generation"
-        },
-        {
-            "source": "huggingface",
-            "title": "Qwen/Qwen2.5-Coder-32B-Instruct",
-            "url": "https://huggingface.co/Qwen/Qwen2.5-Coder-32B-Instruct",
-            "description": "Qwen2.5-Coder is the code version of the Qwen2.5 series",
-            "model_type": "text-generation",
-            "downloads": 300000,
-            "likes": 850,
-            "spaces_url": None,
-            "pipeline_tag": "text-generation"
-        },
-        {
-            "source": "huggingface",
-            "title": "black-forest-labs/FLUX.1-dev",
-            "url": "https://huggingface.co/black-forest-labs/FLUX.1-dev",
-            "description": "FLUX.1 [dev] is a 12 billion parameter flow-based text-to-image model",
-            "model_type": "text-to-image",
-            "downloads": 1000000,
-            "likes": 2500,
-            "spaces_url": None,
-            "pipeline_tag": "text-to-image"
-        },
-        {
-            "source": "huggingface",
-            "title": "mistralai/Mixtral-8x7B-Instruct-v0.1",
-            "url": "https://huggingface.co/mistralai/Mixtral-8x7B-Instruct-v0.1",
-            "description": "Mixtral-8x7B is a sparse mixture of experts model with 46.7B parameters",
-            "model_type": "text-generation",
-            "downloads": 800000,
-            "likes": 1800,
-            "spaces_url": None,
-            "pipeline_tag": "text-generation"
-        },
-        {
-            "source": "huggingface",
-            "title": "stabilityai/stable-diffusion-xl-base-1.0",
-            "url": "https://huggingface.co/stabilityai/stable-diffusion-xl-base-1.0",
-            "description": "SDXL is a latent diffusion model for text-to-image synthesis",
-            "model_type": "text-to-image",
-            "downloads": 2000000,
-            "likes": 3200,
-            "spaces_url": None,
-            "pipeline_tag": "text-to-image"
-        },
-        {
-            "source": "huggingface",
-            "title": "openai/whisper-large-v3",
-            "url": "https://huggingface.co/openai/whisper-large-v3",
-            "description": "Whisper large-v3 model for automatic speech recognition",
-            "model_type": "automatic-speech-recognition",
-            "downloads": 1500000,
-            "likes": 2100,
-            "spaces_url": None,
-            "pipeline_tag": "automatic-speech-recognition"
-        },
-        {
-            "source": "huggingface",
-            "title": "sentence-transformers/all-MiniLM-L6-v2",
-            "url": "https://huggingface.co/sentence-transformers/all-MiniLM-L6-v2",
-            "description": "Sentence embeddings model for semantic search and similarity",
-            "model_type": "sentence-similarity",
-            "downloads": 5000000,
-            "likes": 4500,
-            "spaces_url": None,
-            "pipeline_tag": "sentence-similarity"
-        },
-        {
-            "source": "huggingface",
-            "title": "google/gemma-2-9b-it",
-            "url": "https://huggingface.co/google/gemma-2-9b-it",
-            "description": "Gemma 2 9B is Google's latest open LLM optimized for instruction following",
-            "model_type": "text-generation",
-            "downloads": 600000,
-            "likes": 980,
-            "spaces_url": None,
-            "pipeline_tag": "text-generation"
-        }
-    ],
-    "reddit": [
-        {
-            "source": "reddit",
-            "title": "What's your tech stack for 2025?",
-            "url": "https://www.reddit.com/r/webdev/comments/example1",
-            "subreddit": "webdev",
-            "score": 450,
-            "num_comments": 230,
-            "created_utc": 1735344000.0,
-            "selftext": "What technologies are you planning to use or learn in 2025?",
-            "top_comments": [
-                {
-                    "author": "dev_enthusiast",
-                    "score": 120,
-                    "body": "Next.js 15 with TypeScript, Tailwind CSS, and tRPC for type-safe APIs",
-                    "sentiment": "positive"
-                }
-            ],
-            "community_sentiment": "positive",
-            "has_warning": False,
-            "warning_reason": None,
-            "preview_available": True
-        },
-        {
-            "source": "reddit",
-            "title": "Best AI tools for developers in 2025",
-            "url": "https://www.reddit.com/r/programming/comments/example2",
-            "subreddit": "programming",
-            "score": 380,
-            "num_comments": 156,
-            "created_utc": 1735344000.0,
-            "selftext": "What AI coding assistants are you using?",
-            "top_comments": [
-                {
-                    "author": "coder_pro",
-                    "score": 95,
-                    "body": "Claude and Cursor are game changers for productivity",
-                    "sentiment": "positive"
-                }
-            ],
-            "community_sentiment": "positive",
-            "has_warning": False,
-            "warning_reason": None,
-            "preview_available": True
-        },
-        {
-            "source": "reddit",
-            "title": "Learning path for full-stack development",
-            "url": "https://www.reddit.com/r/learnprogramming/comments/example3",
-            "subreddit": "learnprogramming",
-            "score": 520,
-            "num_comments": 340,
-            "created_utc": 1735344000.0,
-            "selftext": "Complete roadmap for becoming a full-stack developer",
-            "top_comments": [
-                {
-                    "author": "senior_dev",
-                    "score": 180,
-                    "body": "Start with HTML/CSS/JS fundamentals, then React, then Node.js with Express or FastAPI",
-                    "sentiment": "positive"
-                }
-            ],
-            "community_sentiment": "positive",
-            "has_warning": False,
-            "warning_reason": None,
-            "preview_available": True
-        },
-        {
-            "source": "reddit",
-            "title": "How do you stay updated with programming trends?",
-            "url": "https://www.reddit.com/r/programming/comments/example4",
-            "subreddit": "programming",
-            "score": 620,
-            "num_comments": 280,
-            "created_utc": 1735344000.0,
-            "selftext": "With so many new frameworks and tools, how do you keep up?",
-            "top_comments": [
-                {
-                    "author": "tech_lead",
-                    "score": 145,
-                    "body": "Follow key developers on Twitter/X, read Hacker News, and try small projects with new tech",
-                    "sentiment": "positive"
-                }
-            ],
-            "community_sentiment": "positive",
-            "has_warning": False,
-            "warning_reason": None,
-            "preview_available": True
-        },
-        {
-            "source": "reddit",
-            "title": "Switching from REST to GraphQL - Worth it?",
-            "url": "https://www.reddit.com/r/webdev/comments/example5",
-            "subreddit": "webdev",
-            "score": 390,
-            "num_comments": 198,
-            "created_utc": 1735344000.0,
-            "selftext": "Considering migrating our API from REST to GraphQL. Experiences?",
-            "top_comments": [
-                {
-                    "author": "backend_guru",
-                    "score": 110,
-                    "body": "GraphQL is great for complex data fetching, but REST is simpler for straightforward APIs. Depends on your use case.",
-                    "sentiment": "neutral"
-                }
-            ],
-            "community_sentiment": "neutral",
-            "has_warning": False,
-            "warning_reason": None,
-            "preview_available": True
-        },
-        {
-            "source": "reddit",
-            "title": "Best practices for securing web applications",
-            "url": "https://www.reddit.com/r/programming/comments/example6",
-            "subreddit": "programming",
-            "score": 710,
-            "num_comments": 420,
-            "created_utc": 1735344000.0,
-            "selftext": "What security measures do you implement in your projects?",
-            "top_comments": [
-                {
-                    "author": "security_expert",
-                    "score": 230,
-                    "body": "HTTPS everywhere, input validation, parameterized queries, CSRF tokens, and regular dependency updates",
-                    "sentiment": "positive"
-                }
-            ],
-            "community_sentiment": "positive",
-            "has_warning": False,
-            "warning_reason": None,
-            "preview_available": True
-        },
-        {
-            "source": "reddit",
-            "title": "Docker vs Kubernetes - When to use each?",
-            "url": "https://www.reddit.com/r/devops/comments/example7",
-            "subreddit": "devops",
-            "score": 540,
-            "num_comments": 265,
-            "created_utc": 1735344000.0,
-            "selftext": "Is Kubernetes overkill for small projects?",
-            "top_comments": [
-                {
-                    "author": "devops_pro",
-                    "score": 160,
-                    "body": "Docker Compose for development and small deployments. K8s when you need orchestration at scale.",
-                    "sentiment": "positive"
-                }
-            ],
-            "community_sentiment": "positive",
-            "has_warning": False,
-            "warning_reason": None,
-            "preview_available": True
-        },
-        {
-            "source": "reddit",
-            "title": "Remote work setup for developers in 2025",
-            "url": "https://www.reddit.com/r/programming/comments/example8",
-            "subreddit": "programming",
-            "score": 480,
-            "num_comments": 310,
-            "created_utc": 1735344000.0,
-            "selftext": "Share your home office setup and productivity tips",
-            "top_comments": [
-                {
-                    "author": "remote_dev",
-                    "score": 125,
-                    "body": "Dual 4K monitors, mechanical keyboard, ergonomic chair, and noise-cancelling headphones are essentials",
-                    "sentiment": "positive"
-                }
-            ],
-            "community_sentiment": "positive",
-            "has_warning": False,
-            "warning_reason": None,
-            "preview_available": True
-        },
-        {
-            "source": "reddit",
-            "title": "Performance optimization techniques for React apps",
-            "url": "https://www.reddit.com/r/reactjs/comments/example9",
-            "subreddit": "reactjs",
-            "score": 650,
-            "num_comments": 290,
-            "created_utc": 1735344000.0,
-            "selftext": "What are your go-to methods for optimizing React performance?",
-            "top_comments": [
-                {
-                    "author": "react_expert",
-                    "score": 190,
-                    "body": "React.memo, useMemo, useCallback, code splitting, lazy loading, and virtualization for long lists",
-                    "sentiment": "positive"
-                }
-            ],
-            "community_sentiment": "positive",
-            "has_warning": False,
-            "warning_reason": None,
-            "preview_available": True
-        },
-        {
-            "source": "reddit",
-            "title": "Career advice: Specializing vs being a generalist",
-            "url": "https://www.reddit.com/r/cscareerquestions/comments/example10",
-            "subreddit": "cscareerquestions",
-            "score": 820,
-            "num_comments": 456,
-            "created_utc": 1735344000.0,
-            "selftext": "Should I focus on one tech stack or learn multiple?",
-            "top_comments": [
-                {
-                    "author": "senior_engineer",
-                    "score": 280,
-                    "body": "Be T-shaped: deep expertise in one area, broad knowledge across many. Best of both worlds.",
-                    "sentiment": "positive"
-                }
-            ],
-            "community_sentiment": "positive",
-            "has_warning": False,
-            "warning_reason": None,
-            "preview_available": True
-        }
-    ]
+
+# One pickle per source (baked from the JSON by scripts/bake_static.py),
+# each decoded on first access. Decoding builds ordinary Python objects, so
+# each worker process holds its own copy of the (small) tables.
+DATA_DIR = Path(__file__).with_name("trending_data")
+SOURCES = ("github", "huggingface", "reddit")
+
+# Low-cardinality values repeated across records
+INTERNED_FIELDS = (
+    "source", "status", "language", "model_type", "pipeline_tag",
+    "subreddit", "community_sentiment", "top_comment_sentiment",
+)
+
+# Numeric sort keys, each ranked at bake time (see TrendingTable.top)
+NUMERIC_COLUMNS = {
+    "github": ("stars", "last_updated_ts"),
+    "huggingface": ("downloads", "likes"),
+    "reddit": ("score", "num_comments"),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class GithubRepo:
+    """Static GitHub repository record."""
+    source: str
+    title: str
+    url: str
+    description: Optional[str]
+    stars: Optional[int]
+    language: Optional[str]
+    last_updated_ts: Optional[int]  # Epoch seconds, UTC
+    status: str
+    clone_command: Optional[str]
+    readme_preview: Optional[str]
+    topics: tuple[str, ...]
+    
+    @property
+    def last_updated(self) -> Optional[str]:
+        """Last update as an ISO 8601 UTC string."""
+        if self.last_updated_ts is None:
+            return None
+        return datetime.fromtimestamp(self.last_updated_ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@dataclass(slots=True, frozen=True)
+class HFModel:
+    """Static Hugging Face model record."""
+    source: str
+    title: str
+    url: str
+    description: Optional[str]
+    model_type: Optional[str]
+    downloads: Optional[int]
+    likes: Optional[int]
+    spaces_url: Optional[str]
+    pipeline_tag: Optional[str]
+
+
+@dataclass(slots=True, frozen=True)
+class RedditPost:
+    """Static Reddit discussion record, with its top comment flattened in."""
+    source: str
+    title: str
+    url: str
+    subreddit: str
+    score: int
+    num_comments: int
+    created_utc: Optional[float]
+    selftext: Optional[str]
+    top_comment_author: Optional[str]
+    top_comment_score: Optional[int]
+    top_comment_body: Optional[str]
+    top_comment_sentiment: Optional[str]
+    community_sentiment: str
+    has_warning: bool
+    warning_reason: Optional[str]
+    preview_available: bool
+    
+    @property
+    def top_comments(self) -> tuple[dict[str, Any], ...]:
+        """The top comment in RedditResult's nested shape."""
+        if self.top_comment_author is None:
+            return ()
+        return ({
+            "author": self.top_comment_author,
+            "score": self.top_comment_score,
+            "body": self.top_comment_body,
+            "sentiment": self.top_comment_sentiment,
+        },)
+
+
+def _intern_fields(record: dict[str, Any]) -> dict[str, Any]:
+    """Intern the repeated string values of a raw record in place."""
+    for field in INTERNED_FIELDS:
+        value = record.get(field)
+        if isinstance(value, str):
+            record[field] = sys.intern(value)
+    return record
+
+
+def _load_artifact(source: str) -> dict[str, Any]:
+    """Unpickle a baked artifact."""
+    return pickle.loads((DATA_DIR / f"{source}.pkl").read_bytes())
+
+
+RECORD_TYPES = {
+    "github": GithubRepo,
+    "huggingface": HFModel,
+    "reddit": RedditPost,
 }
+
+
+class TrendingTable(Sequence):
+    """Records of one source plus baked rankings for its numeric sort keys."""
+    
+    __slots__ = ("rows", "rankings")
+    
+    def __init__(self, rows: tuple, rankings: dict[str, array]):
+        self.rows = rows
+        # Row indices per column, largest first (missing values last),
+        # precomputed at bake time
+        self.rankings = rankings
+    
+    def __getitem__(self, index):
+        return self.rows[index]
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def top(self, column: str, n: int) -> list:
+        """Return the n records with the largest values in a numeric column."""
+        return [self.rows[i] for i in self.rankings[column][:n]]
+
+
+class _LazyTrending(Mapping):
+    """Read-only source -> table mapping that loads each source on demand."""
+    
+    def __init__(self):
+        self._cache: dict[str, TrendingTable] = {}
+    
+    def __getitem__(self, source: str) -> TrendingTable:
+        records = self._cache.get(source)
+        if records is None:
+            if source not in SOURCES:
+                raise KeyError(source)
+            artifact = _load_artifact(source)
+            record_type = RECORD_TYPES[source]
+            rows = tuple(
+                record_type(**_intern_fields(record))
+                for record in artifact["records"]
+            )
+            records = TrendingTable(rows, artifact["rankings"])
+            self._cache[source] = records
+        return records
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(SOURCES)
+    
+    def __len__(self) -> int:
+        return len(SOURCES)
+
+
+STATIC_TRENDING = _LazyTrending()
+
+
+# Typed accessors for callers that want records rather than the mapping.
+# Each returns the rows cached by STATIC_TRENDING, so no call rebuilds them.
+def github_rows() -> tuple[GithubRepo, ...]:
+    return STATIC_TRENDING["github"].rows
+
+
+def huggingface_rows() -> tuple[HFModel, ...]:
+    return STATIC_TRENDING["huggingface"].rows
+
+
+def reddit_rows() -> tuple[RedditPost, ...]:
+    return STATIC_TRENDING["reddit"].rows